@@ -6,27 +6,35 @@ High-level entrypoints:
 - MethodEntry
 """
 
+import importlib.util
+
 from .core import BasePlugin, MethodEntry, Switcher
 from .plugins import LoggingPlugin
 
-# PydanticPlugin is conditionally imported in plugins/__init__.py
-# Only available if pydantic is installed
-try:
-    from .plugins import PydanticPlugin
-
-    __all__ = [
-        "Switcher",
-        "BasePlugin",
-        "MethodEntry",
-        "LoggingPlugin",
-        "PydanticPlugin",
-    ]
-except ImportError:
-    __all__ = [
-        "Switcher",
-        "BasePlugin",
-        "MethodEntry",
-        "LoggingPlugin",
-    ]
+# PydanticPlugin is resolved lazily (PEP 562) so importing smartswitch
+# doesn't pay the pydantic import cost. It is only exported when pydantic
+# is installed, mirroring the eager-import behavior this replaced.
+__all__ = [
+    "Switcher",
+    "BasePlugin",
+    "MethodEntry",
+    "LoggingPlugin",
+]
+if importlib.util.find_spec("pydantic") is not None:
+    __all__.append("PydanticPlugin")
 
 __version__ = "0.11.0"
+
+
+def __getattr__(name: str):
+    if name == "PydanticPlugin":
+        try:
+            from .plugins import PydanticPlugin
+        except ImportError:
+            # pydantic not installed: report a missing attribute so
+            # hasattr() probes keep returning False
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r} (pydantic is not installed)"
+            ) from None
+        return PydanticPlugin
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -21,6 +21,8 @@ Key features implemented here:
 from __future__ import annotations
 
 import contextvars
+import importlib
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Type
 
@@ -105,41 +107,46 @@ class MethodConfigProxy:
         sw.logging.configure['calculate'].level = 'DEBUG'
     """
 
+    # Proxies are created per configure access; __slots__ drops the
+    # per-instance __dict__ they would otherwise each carry.
+    __slots__ = ("_plugin", "_method_names", "_methods", "_first")
+
     def __init__(self, plugin: "BasePlugin", method_names: str):
         """
         Args:
             plugin: The plugin instance
             method_names: Single method or comma-separated ('calculate,clear')
         """
+        # Split once here: every property access below needs either the
+        # full method list or its first element.
+        methods = [m.strip() for m in method_names.split(",")]
         object.__setattr__(self, "_plugin", plugin)
         object.__setattr__(self, "_method_names", method_names)
+        object.__setattr__(self, "_methods", methods)
+        object.__setattr__(self, "_first", methods[0])
 
     @property
     def flags(self) -> str:
         """Get merged flags for this method (only active boolean flags)."""
-        first = self._method_names.split(",")[0].strip()
-        cfg = self._plugin.get_config(first)
+        cfg = self._plugin.get_config(self._first)
         enabled = [k for k, v in cfg.items() if isinstance(v, bool) and v]
         return ",".join(enabled)
 
     @flags.setter
     def flags(self, value: str):
         """Set flags for this/these method(s)."""
-        methods = [m.strip() for m in self._method_names.split(",")]
-        self._plugin._update_config(*methods, flags=value)
+        self._plugin._update_config(*self._methods, flags=value)
 
     @property
     def config(self) -> dict:
         """Get full merged configuration for method."""
-        first = self._method_names.split(",")[0].strip()
-        return self._plugin.get_config(first)
+        return self._plugin.get_config(self._first)
 
     def __getattr__(self, name: str):
         """Get any merged config parameter for this method."""
         if name.startswith("_"):
             return object.__getattribute__(self, name)
-        first = self._method_names.split(",")[0].strip()
-        cfg = self._plugin.get_config(first)
+        cfg = self._plugin.get_config(self._first)
         return cfg.get(name)
 
     def __setattr__(self, name: str, value: Any):
@@ -147,8 +154,7 @@ class MethodConfigProxy:
         if name.startswith("_"):
             object.__setattr__(self, name, value)
         else:
-            methods = [m.strip() for m in self._method_names.split(",")]
-            self._plugin._update_config(*methods, **{name: value})
+            self._plugin._update_config(*self._methods, **{name: value})
 
 
 class ConfigureProxy:
@@ -160,6 +166,8 @@ class ConfigureProxy:
         sw.logging.configure['calculate'].flags = 'time'
     """
 
+    __slots__ = ("_plugin",)
+
     def __init__(self, plugin: "BasePlugin"):
         object.__setattr__(self, "_plugin", plugin)
 
@@ -207,6 +215,59 @@ class ConfigureProxy:
 # PLUGIN BASE
 # ============================================================
 
+# Lazily resolved pydantic.BaseModel class: None = not yet attempted,
+# False = pydantic unavailable. Keeping this cached avoids re-running the
+# import machinery on every plugin instantiation while still deferring the
+# (optional) pydantic import until a config_model is actually validated.
+_pydantic_base_model: Any = None
+
+
+def _get_pydantic_base_model() -> Optional[type]:
+    """Return pydantic.BaseModel if pydantic is installed, else None."""
+    global _pydantic_base_model
+    if _pydantic_base_model is None:
+        try:
+            from pydantic import BaseModel
+
+            _pydantic_base_model = BaseModel
+        except ImportError:
+            _pydantic_base_model = False
+    return _pydantic_base_model or None
+
+
+# config_model class -> frozenset of boolean field names.
+# Computed once per model: flag parsing happens on every configure call
+# and should not re-import pydantic or re-walk model_fields each time.
+_bool_fields_cache: Dict[type, frozenset] = {}
+
+
+def _bool_fields_for(config_model: Optional[type]) -> frozenset:
+    """Return the boolean field names declared by a plugin config model."""
+    if config_model is None:
+        return frozenset()
+    cached = _bool_fields_cache.get(config_model)
+    if cached is None:
+        fields: Set[str] = set()
+        base_model = _get_pydantic_base_model()
+        try:
+            if (
+                base_model is not None
+                and isinstance(config_model, type)
+                and issubclass(config_model, base_model)
+            ):
+                # The issubclass guard above proves this is a BaseModel
+                # subclass, but mypy only sees Optional[type].
+                fields = {
+                    name
+                    for name, field_info in config_model.model_fields.items()  # type: ignore[attr-defined]  # noqa: E501
+                    if field_info.annotation in (bool, Optional[bool])
+                }
+        except AttributeError:
+            pass
+        cached = frozenset(fields)
+        _bool_fields_cache[config_model] = cached
+    return cached
+
 
 class BasePlugin:
     """
@@ -266,22 +327,30 @@ class BasePlugin:
 
         # Validate with Pydantic if config_model defined
         if self.config_model is not None:
-            try:
-                from pydantic import BaseModel
-
-                if isinstance(self.config_model, type) and issubclass(self.config_model, BaseModel):
-                    # Validate and extract config
-                    validated = self.config_model(**config)
-                    self._global_config = validated.model_dump(exclude={"methods"})
-                else:
-                    self._global_config = dict(config)
-            except ImportError:
-                # Pydantic not available, use dict
+            base_model = _get_pydantic_base_model()
+            if (
+                base_model is not None
+                and isinstance(self.config_model, type)
+                and issubclass(self.config_model, base_model)
+            ):
+                # Validate and extract config. As in _bool_fields_for, the
+                # issubclass guard proves this is a BaseModel but mypy only
+                # sees object.
+                validated = self.config_model(**config)
+                self._global_config = validated.model_dump(  # type: ignore[attr-defined]
+                    exclude={"methods"}
+                )
+            else:
+                # Pydantic not available (or not a model), use dict
                 self._global_config = dict(config)
         else:
             self._global_config = dict(config)
 
         self._handler_configs: Dict[str, Dict[str, Any]] = {}
+        # method name (or None for global) -> merged config, rebuilt lazily
+        # after each configuration update. Merging runs on every wrapped
+        # call via is_enabled_for, so it must not redo the dict merge.
+        self._merged_config_cache: Dict[Optional[str], Dict[str, Any]] = {}
 
         # Keep backward compatibility
         self.config = self._global_config
@@ -302,20 +371,8 @@ class BasePlugin:
         """
         result = {}
 
-        # Get boolean fields from config_model if available
-        bool_fields = set()
-        if self.config_model is not None:
-            try:
-                from pydantic import BaseModel
-
-                if isinstance(self.config_model, type) and issubclass(self.config_model, BaseModel):
-                    bool_fields = {
-                        name
-                        for name, field_info in self.config_model.model_fields.items()
-                        if field_info.annotation in (bool, Optional[bool])
-                    }
-            except (ImportError, AttributeError):
-                pass
+        # Boolean fields from config_model (computed once per model class)
+        bool_fields = _bool_fields_for(self.config_model)
 
         # Parse flags
         for flag in flags.split(","):
@@ -358,6 +415,7 @@ class BasePlugin:
                 method_name = method_name.strip()
                 if method_name:
                     self._handler_configs[method_name] = merged
+        self._merged_config_cache.clear()
 
     # ------------------------------------------------------------
     # Configuration helpers
@@ -380,11 +438,13 @@ class BasePlugin:
 
         if not method_names:
             self._global_config.update(config)
+            self._merged_config_cache.clear()
             return
 
         for name in method_names:
             bucket = self._handler_configs.setdefault(name, {})
             bucket.update(config)
+        self._merged_config_cache.clear()
 
     @property
     def configure(self) -> ConfigureProxy:
@@ -398,17 +458,23 @@ class BasePlugin:
         """
         return ConfigureProxy(self)
 
+    def _merged_config(self, method_name: Optional[str] = None) -> Dict[str, Any]:
+        """Return the cached merged configuration (internal, read-only)."""
+        cached = self._merged_config_cache.get(method_name)
+        if cached is None:
+            merged = dict(self._global_config)
+            if method_name and method_name in self._handler_configs:
+                merged.update(self._handler_configs[method_name])
+            self._merged_config_cache[method_name] = cached = merged
+        return cached
+
     def get_config(self, method_name: Optional[str] = None) -> Dict[str, Any]:
         """Return merged configuration for the given method name."""
-        merged = dict(self._global_config)
-        if method_name and method_name in self._handler_configs:
-            merged.update(self._handler_configs[method_name])
-        return merged
+        return dict(self._merged_config(method_name))
 
     def is_enabled_for(self, method_name: Optional[str] = None) -> bool:
         """Determine whether the plugin is enabled for the given method."""
-        cfg = self.get_config(method_name)
-        enabled = cfg.get("enabled", True)
+        enabled = self._merged_config(method_name).get("enabled", True)
         return bool(enabled)
 
     def to_spec(self) -> _PluginSpec:
@@ -453,6 +519,8 @@ class _SwitchCall:
     - a named/dotted-path dispatch handle (when later called with normal args)
     """
 
+    __slots__ = ("_switch", "_selector")
+
     def __init__(self, switch: "Switcher", selector: str):
         self._switch = switch
         self._selector = selector
@@ -506,6 +574,12 @@ class Switcher:
 
     _global_plugin_registry: Dict[str, Type[BasePlugin]] = {}
 
+    # Optional bundled plugins resolved on first plug() by name, so that
+    # importing smartswitch doesn't pull in their third-party dependencies.
+    _lazy_plugin_modules: Dict[str, Tuple[str, str]] = {
+        "pydantic": ("smartswitch.plugins.pydantic", "PydanticPlugin"),
+    }
+
     @classmethod
     def register_plugin(cls, name: str, plugin_class: Type[BasePlugin]) -> None:
         """Register a plugin globally so it can be referenced by string name."""
@@ -513,6 +587,27 @@ class Switcher:
             raise TypeError("plugin_class must be a BasePlugin subclass")
         cls._global_plugin_registry[name] = plugin_class
 
+    @classmethod
+    def _load_lazy_plugin(cls, name: str) -> Optional[Type[BasePlugin]]:
+        """Import and register a bundled optional plugin, if one exists.
+
+        Resolving via getattr (rather than relying on the module's import-time
+        registration) keeps this working even when the registry has been
+        reset after the module was first imported.
+        """
+        target = cls._lazy_plugin_modules.get(name)
+        if target is None:
+            return None
+        module_name, attr = target
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            return None
+        plugin_class = getattr(module, attr, None)
+        if plugin_class is not None and name not in cls._global_plugin_registry:
+            cls.register_plugin(name, plugin_class)
+        return plugin_class
+
     @classmethod
     def registered_plugins(cls) -> Dict[str, Type[BasePlugin]]:
         """Return the map of registered plugin names to their classes."""
@@ -543,11 +638,21 @@ class Switcher:
         self._local_plugin_specs: List[_PluginSpec] = []
         self._plugins_by_name: Dict[str, BasePlugin] = {}  # For attribute access
         self._inherited_plugins: List[BasePlugin] = []
+        self._inherited_by_name: Dict[str, BasePlugin] = {}
         self._inherited_plugin_specs: List[_PluginSpec] = []
         self._inherit_plugins: bool = True if inherit_plugins is None else bool(inherit_plugins)
         self._using_parent_plugins: bool = False
+        # Cached tuple of active plugins; reset whenever the stack mutates.
+        self._active_plugins: Optional[Tuple[BasePlugin, ...]] = None
         self._children: Dict[str, "Switcher"] = {}
         self._methods: Dict[str, MethodEntry] = {}
+        # Original function -> wrapped callable, for identity-keyed dispatch
+        self._by_func: Dict[Callable, Callable] = {}
+        # Resolved selector -> wrapped callable, filled lazily by
+        # _dispatch_by_name so repeated dispatches skip path resolution.
+        self._selector_cache: Dict[str, Callable] = {}
+        # Dotted selector -> (switch, method_name), memoized by _resolve_path.
+        self._path_cache: Dict[str, Tuple["Switcher", str]] = {}
 
         if parent is not None:
             parent.add_child(self)
@@ -573,6 +678,16 @@ class Switcher:
         Raises:
             NotImplementedError: If handler not found and no default_handler provided
         """
+        # Fast path: no runtime options and no stored defaults means the
+        # answer is just the wrapped handler - skip SmartOptions entirely.
+        # This is the common case for sw['name'] lookups in tight loops.
+        if not options and not self.get_kwargs:
+            node, method_name = self._resolve_path(name)
+            entry = node._methods.get(method_name)
+            if entry is None:
+                raise NotImplementedError(f"Method '{name}' not found")
+            return entry._wrapped  # type: ignore[attr-defined, no-any-return]
+
         opts = SmartOptions(incoming=options, defaults=self.get_kwargs)
 
         # Resolve dotted path if present (e.g., "child.method")
@@ -592,9 +707,17 @@ class Switcher:
             # Get the wrapped handler (with all plugins applied)
             handler = entry._wrapped  # type: ignore[attr-defined]
 
-        # Wrap with smartasync if requested
+        # Wrap with smartasync if requested; the wrapper is memoized on the
+        # entry so repeated lookups reuse the same callable instead of
+        # rebuilding it on every get().
         if getattr(opts, "use_smartasync", False):
-            handler = smartasync(handler)
+            if entry is not None:
+                handler = getattr(entry, "_wrapped_async", None)
+                if handler is None:
+                    handler = smartasync(entry._wrapped)  # type: ignore[attr-defined]
+                    entry._wrapped_async = handler  # type: ignore[attr-defined]
+            else:
+                handler = smartasync(handler)
 
         return handler
 
@@ -661,6 +784,7 @@ class Switcher:
             child._using_parent_plugins = True
             child._local_plugins.clear()
             child._local_plugin_specs.clear()
+            child._active_plugins = None
 
     @staticmethod
     def _iter_unbound_switchers(source: Any) -> Iterator[Tuple[str, "Switcher"]]:
@@ -697,13 +821,17 @@ class Switcher:
     def plug(self, plugin: Any, **config: Any) -> "Switcher":
         """Attach a plugin instance, class, or registered name to this switch."""
         if isinstance(plugin, str):
+            plugin_class: Optional[Type[BasePlugin]]
             try:
                 plugin_class = self._global_plugin_registry[plugin]
             except KeyError:
-                available = ", ".join(sorted(self._global_plugin_registry.keys()))
-                raise ValueError(
-                    f"Unknown plugin name {plugin!r}. Registered plugins: {available or 'none'}"
-                )
+                plugin_class = self._load_lazy_plugin(plugin)
+                if plugin_class is None:
+                    available = ", ".join(sorted(self._global_plugin_registry.keys()))
+                    raise ValueError(
+                        f"Unknown plugin name {plugin!r}. "
+                        f"Registered plugins: {available or 'none'}"
+                    )
             init_kwargs = dict(config)
             init_kwargs.setdefault("name", plugin)
             p = plugin_class(**init_kwargs)
@@ -714,7 +842,9 @@ class Switcher:
             spec = _PluginSpec(plugin, init_kwargs, p.name)
         elif isinstance(plugin, BasePlugin):
             p = plugin
-            p.config.update(config)
+            if config:
+                # Go through _update_config so merged-config caches refresh
+                p._update_config(**config)
             spec = p.to_spec()
         else:
             raise TypeError("plugin must be BasePlugin subclass or instance")
@@ -728,13 +858,16 @@ class Switcher:
         self._local_plugin_specs.append(spec)
         # Store plugin by name for attribute access (sw.logging, etc.)
         self._plugins_by_name[p.name] = p
+        self._active_plugins = None
         return self
 
-    def iter_plugins(self) -> List[BasePlugin]:
-        """Return ordered list of active plugins for this switch."""
-        if self._using_parent_plugins:
-            return list(self._inherited_plugins)
-        return list(self._local_plugins)
+    def iter_plugins(self) -> Tuple[BasePlugin, ...]:
+        """Return ordered tuple of active plugins for this switch."""
+        plugins = self._active_plugins
+        if plugins is None:
+            source = self._inherited_plugins if self._using_parent_plugins else self._local_plugins
+            plugins = self._active_plugins = tuple(source)
+        return plugins
 
     def iter_plugin_specs(self) -> List[_PluginSpec]:
         """Return ordered list of plugin specifications."""
@@ -758,6 +891,13 @@ class Switcher:
             logger = sw.plugin("logging")
             history = logger.history()
         """
+        # Fast path: plugins are indexed by name at attach time, so the
+        # common sw.<plugin> attribute access is a single dict lookup.
+        mapping = self._inherited_by_name if self._using_parent_plugins else self._plugins_by_name
+        plugin = mapping.get(name)
+        if plugin is not None:
+            return plugin
+        # Fallback scan covers plugins renamed after being attached.
         for p in self.iter_plugins():
             if p.name == name:
                 return p
@@ -802,6 +942,8 @@ class Switcher:
         self._using_parent_plugins = True
         self._local_plugins.clear()
         self._local_plugin_specs.clear()
+        self._plugins_by_name.clear()
+        self._active_plugins = None
 
     def copy_plugins_from_parent(self) -> None:
         """Copy the parent's plugin stack into local plugins."""
@@ -812,6 +954,8 @@ class Switcher:
         self._using_parent_plugins = False
         self._local_plugin_specs = [spec.clone() for spec in self._inherited_plugin_specs]
         self._local_plugins = [spec.instantiate() for spec in self._local_plugin_specs]
+        self._plugins_by_name = {p.name: p for p in self._local_plugins}
+        self._active_plugins = None
 
     # --------------------------------------------------------
     # Plugin inheritance sync
@@ -820,10 +964,14 @@ class Switcher:
         if self.parent is None:
             self._inherited_plugin_specs = []
             self._inherited_plugins = []
+            self._inherited_by_name = {}
+            self._active_plugins = None
             return
         parent_specs = self.parent.iter_plugin_specs()
         self._inherited_plugin_specs = [spec.clone() for spec in parent_specs]
         self._inherited_plugins = [spec.instantiate() for spec in self._inherited_plugin_specs]
+        self._inherited_by_name = {p.name: p for p in self._inherited_plugins}
+        self._active_plugins = None
 
     # --------------------------------------------------------
     # Name normalization & collision detection
@@ -839,7 +987,9 @@ class Switcher:
             raise ValueError(
                 f"Method name collision in switch {self.name!r}: {name!r} already registered"
             )
-        return name
+        # Interned registry keys let dict lookups hit the pointer-equality
+        # fast path when callers pass literal selectors.
+        return sys.intern(name)
 
     # --------------------------------------------------------
     # Decoration
@@ -872,15 +1022,27 @@ class Switcher:
             next_layer = wrapped
 
             def make_layer(plg: BasePlugin, call_next: Callable) -> Callable:
+                # Specialize at decoration time: a plugin that never overrode
+                # wrap_handler (or returned call_next unchanged) contributes no
+                # call-time behavior, so a gating layer would only add a frame
+                # per call. Such plugins keep their on_decore effects.
+                if type(plg).wrap_handler is BasePlugin.wrap_handler:
+                    return call_next
+                # Resolve everything the layer needs once, at decoration time:
+                # the per-call body then runs on plain local loads only.
                 plugin_name = plg.name
                 entry_name = entry.name
                 wrapped_call = plg.wrap_handler(self, entry, call_next)
+                if wrapped_call is call_next:
+                    return call_next
+                enabled_for = plg.is_enabled_for if hasattr(plg, "is_enabled_for") else None
+                is_plugin_enabled = self.is_plugin_enabled
 
                 def layer(*args, **kwargs):
-                    if hasattr(plg, "is_enabled_for") and not plg.is_enabled_for(entry_name):
+                    if enabled_for is not None and not enabled_for(entry_name):
                         return call_next(*args, **kwargs)
                     instance = args[0] if args else None
-                    if not self.is_plugin_enabled(instance, entry_name, plugin_name):
+                    if not is_plugin_enabled(instance, entry_name, plugin_name):
                         return call_next(*args, **kwargs)
                     return wrapped_call(*args, **kwargs)
 
@@ -895,6 +1057,8 @@ class Switcher:
 
         # Save in registry
         self._methods[logical_name] = entry
+        self._by_func[func] = wrapped
+        self._selector_cache.clear()
 
         return wrapped
 
@@ -961,7 +1125,11 @@ class Switcher:
         method_name: str,
         plugin_name: str,
     ) -> bool:
-        m = _get_activation_map()
+        # Runs on every wrapped handler call: with no overrides recorded in
+        # this context, skip both the map creation and the key-tuple build.
+        m = _activation_ctx.get()
+        if not m:
+            return True
         key = self._activation_key(instance, method_name, plugin_name)
         value = m.get(key, None)
         if value is None:
@@ -993,8 +1161,14 @@ class Switcher:
         key: str,
         default: Any = None,
     ) -> Any:
-        m = _get_runtime_map()
-        slot = m.get(self._runtime_key(instance, method_name, plugin_name), {})
+        # Same hot-path discipline as is_plugin_enabled: no stored data in
+        # this context means no key tuple and no throwaway empty dict.
+        m = _runtime_ctx.get()
+        if not m:
+            return default
+        slot = m.get(self._runtime_key(instance, method_name, plugin_name))
+        if slot is None:
+            return default
         return slot.get(key, default)
 
     # --------------------------------------------------------
@@ -1005,31 +1179,81 @@ class Switcher:
         Resolve a dotted path "a.b.c.method" into (switch, method_name).
 
         If there are no dots, returns (self, selector).
+
+        Dotted resolutions are memoized: attached children are never
+        replaced, so a resolved path stays valid for the switch lifetime.
         """
         if "." not in selector:
             return self, selector
+        cached = self._path_cache.get(selector)
+        if cached is not None:
+            return cached
         parts = selector.split(".")
         node: Switcher = self
         for seg in parts[:-1]:
             node = node.get_child(seg)
-        return node, parts[-1]
+        resolved = (node, parts[-1])
+        # Keep the cache bounded in case selectors are generated dynamically.
+        if len(self._path_cache) < 1024:
+            self._path_cache[selector] = resolved
+        return resolved
+
+    def dispatch(self, selector: str, *args, **kwargs):
+        """
+        Invoke a registered handler by name or dotted path in a single call.
+
+        Like ``sw[selector](*args, **kwargs)`` but goes straight through
+        the selector cache, avoiding the intermediate lookup step. The
+        error contract matches ``sw(selector)(...)`` dispatch: an unknown
+        selector raises KeyError (``sw[selector]`` raises
+        NotImplementedError instead).
+
+        Example:
+            sw.dispatch("run", obj, 5)
+            sw.dispatch("child.method", obj, 3)
+        """
+        return self._dispatch_by_name(selector, *args, **kwargs)
+
+    def call(self, func: Callable, *args, **kwargs):
+        """
+        Invoke the wrapper registered for *func* via identity lookup.
+
+        Fast path for callers that kept a reference to the original
+        (undecorated) function: a single identity-keyed dict lookup
+        replaces name normalization and selector resolution.
+
+        Example:
+            def run(x): ...
+            sw(run)
+            sw.call(run, 5)
+        """
+        try:
+            wrapped = self._by_func[func]
+        except KeyError:
+            raise NotImplementedError(
+                f"Function {getattr(func, '__name__', func)!r} not registered "
+                f"in switch {self.name!r}"
+            ) from None
+        return wrapped(*args, **kwargs)
 
     def _dispatch_by_name(self, selector: str, *args, **kwargs):
+        # Fast path: previously resolved selectors go straight to the wrapper.
+        # Misses are never cached and registered names are never replaced,
+        # so entries cannot go stale; _decorate still clears defensively.
+        wrapped = self._selector_cache.get(selector)
+        if wrapped is not None:
+            return wrapped(*args, **kwargs)
         node, method_name = self._resolve_path(selector)
         try:
             entry = node._methods[method_name]
         except KeyError:
             raise KeyError(f"Unknown method {method_name!r} for selector {selector!r}")
-        # Use the wrapped function we built at decoration time
-        wrapped = getattr(entry.func, "__wrapped__", None)
-        # We did not attach __wrapped__, so use the final wrapper chain we created:
-        # we stored only the original func; we must reconstruct a bound wrapper.
-        # Instead, we can re-build the wrapper chain when decorating and store
-        # the final wrapper inside metadata; let's do that from now on.
+        # Use the wrapper chain built at decoration time; fall back to the
+        # original function if decoration did not set it (should not happen).
         wrapped = getattr(entry, "_wrapped", None)
         if wrapped is None:
-            # As a fallback (should not happen if _decorate sets _wrapped):
             wrapped = entry.func
+        self._selector_cache[selector] = wrapped
         return wrapped(*args, **kwargs)
 
     # --------------------------------------------------------
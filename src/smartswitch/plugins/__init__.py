@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
+import importlib.util
+
 # Import logging plugin (always available)
 from .logging import LoggingPlugin
 
-# Import pydantic plugin only if pydantic is installed
-try:
-    from .pydantic import PydanticPlugin
+# PydanticPlugin is resolved lazily (PEP 562) so importing smartswitch
+# doesn't pay the pydantic import cost; plug("pydantic") triggers it.
+# It is only exported when pydantic is installed.
+__all__ = ["LoggingPlugin"]
+if importlib.util.find_spec("pydantic") is not None:
+    __all__.append("PydanticPlugin")
+
 
-    __all__ = ["LoggingPlugin", "PydanticPlugin"]
-except ImportError:
-    # Pydantic not installed - plugin not available
-    __all__ = ["LoggingPlugin"]
+def __getattr__(name: str):
+    if name == "PydanticPlugin":
+        try:
+            from .pydantic import PydanticPlugin
+        except ImportError:
+            # pydantic not installed: report a missing attribute so
+            # hasattr() probes keep returning False
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r} (pydantic is not installed)"
+            ) from None
+        return PydanticPlugin
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -15,51 +15,86 @@ if TYPE_CHECKING:
 
 from ..core import BasePlugin
 
-try:
-    from pydantic import BaseModel, Field
+# Types whose str() output matches their repr(), so argument formatting
+# can skip the generic repr dispatch.
+_CHEAP_REPR = (int, float, bool, type(None))
 
-    PYDANTIC_AVAILABLE = True
-except ImportError:
-    PYDANTIC_AVAILABLE = False
-    # Fallback for when Pydantic is not available
-    BaseModel = object  # type: ignore
+# Lazily built LoggingConfig class: building it on first use (rather than
+# at module import) keeps `import smartswitch` from paying the pydantic
+# import cost, since this module is imported eagerly by the package.
+_logging_config_model: Optional[type] = None
 
-    def Field(*args, **kwargs):  # type: ignore  # noqa: N802
-        return kwargs.get("default")
 
+def _get_logging_config_model() -> type:
+    """Build (once) and return the LoggingConfig model class.
 
-class LoggingConfig(BaseModel if PYDANTIC_AVAILABLE else object):  # type: ignore
+    Falls back to a plain class when pydantic is not installed, in which
+    case BasePlugin skips validation and uses the raw config dict.
     """
-    Configuration model for LoggingPlugin.
+    global _logging_config_model
+    if _logging_config_model is not None:
+        return _logging_config_model
 
-    All boolean flags can be set via the 'flags' parameter:
-        flags='print,enabled,after'  →  print=True, enabled=True, after=True
-        flags='print:off,log'        →  print=False, log=True
-    """
+    try:
+        from pydantic import BaseModel, Field
+
+        pydantic_available = True
+    except ImportError:
+        pydantic_available = False
+        # Fallback for when Pydantic is not available
+        BaseModel = object  # type: ignore  # noqa: N806
+
+        def Field(*args, **kwargs):  # type: ignore  # noqa: N802
+            return kwargs.get("default")
+
+    class LoggingConfig(BaseModel if pydantic_available else object):  # type: ignore
+        """
+        Configuration model for LoggingPlugin.
+
+        All boolean flags can be set via the 'flags' parameter:
+            flags='print,enabled,after'  →  print=True, enabled=True, after=True
+            flags='print:off,log'        →  print=False, log=True
+        """
 
-    # State flag
-    enabled: bool = Field(default=False, description="Enable plugin")
+        # State flag
+        enabled: bool = Field(default=False, description="Enable plugin")
 
-    # Output destination (mutually exclusive in practice)
-    print: bool = Field(default=False, description="Use print() for output")
-    log: bool = Field(default=True, description="Use Python logging")
+        # Output destination (mutually exclusive in practice)
+        print: bool = Field(default=False, description="Use print() for output")
+        log: bool = Field(default=True, description="Use Python logging")
 
-    # Content flags
-    before: bool = Field(default=True, description="Show input parameters")
-    after: bool = Field(default=False, description="Show return value")
-    time: bool = Field(default=False, description="Show execution time")
+        # Content flags
+        before: bool = Field(default=True, description="Show input parameters")
+        after: bool = Field(default=False, description="Show return value")
+        time: bool = Field(default=False, description="Show execution time")
 
-    # Per-method overrides (handled by BasePlugin)
-    methods: Optional[Dict[str, "LoggingConfig"]] = Field(
-        default=None, description="Per-method configuration overrides"
-    )
+        # Per-method overrides (handled by BasePlugin)
+        methods: Optional[Dict[str, "LoggingConfig"]] = Field(
+            default=None, description="Per-method configuration overrides"
+        )
 
-    if PYDANTIC_AVAILABLE:
+        if pydantic_available:
 
-        class Config:
-            """Pydantic model configuration."""
+            class Config:
+                """Pydantic model configuration."""
 
-            extra = "forbid"  # Reject unknown fields
+                extra = "forbid"  # Reject unknown fields
+
+    if pydantic_available:
+        # Resolve the self-referencing 'methods' annotation, which pydantic
+        # can't see from module globals now that the class is built here.
+        LoggingConfig.model_rebuild()
+
+    _logging_config_model = LoggingConfig
+    return LoggingConfig
+
+
+def __getattr__(name: str):
+    # Keep `from smartswitch.plugins.logging import LoggingConfig` working
+    # without forcing the model build at import time (PEP 562).
+    if name == "LoggingConfig":
+        return _get_logging_config_model()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class LoggingPlugin(BasePlugin):
@@ -110,7 +145,7 @@ class LoggingPlugin(BasePlugin):
         >>> sw.logging.configure['calculate'].flags = 'enabled:off'
     """
 
-    config_model = LoggingConfig
+    config_model = None  # Built lazily; see _get_logging_config_model()
 
     def __init__(
         self,
@@ -126,6 +161,10 @@ class LoggingPlugin(BasePlugin):
             logger: Custom logger instance (default: logger named 'smartswitch')
             **kwargs: Configuration parameters (flags, print, enabled, etc.)
         """
+        # First instantiation builds the config model, deferring the
+        # pydantic import out of `import smartswitch`
+        if LoggingPlugin.config_model is None:
+            LoggingPlugin.config_model = _get_logging_config_model()
         # Let BasePlugin handle all configuration via Pydantic
         super().__init__(name=name or "logger", **kwargs)
 
@@ -154,11 +193,13 @@ class LoggingPlugin(BasePlugin):
 
     def _format_args(self, args: tuple, kwargs: dict) -> str:
         """Format arguments for display."""
+        # str() and repr() agree for these types, and str() is cheaper.
+        cheap = _CHEAP_REPR
         parts = []
-        if args:
-            parts.extend(repr(arg) for arg in args)
-        if kwargs:
-            parts.extend(f"{k}={repr(v)}" for k, v in kwargs.items())
+        for arg in args:
+            parts.append(str(arg) if arg.__class__ in cheap else repr(arg))
+        for k, v in kwargs.items():
+            parts.append(f"{k}={v}" if v.__class__ in cheap else f"{k}={v!r}")
         return ", ".join(parts)
 
     def on_decore(
@@ -193,10 +234,16 @@ class LoggingPlugin(BasePlugin):
             Wrapped function that logs calls
         """
         handler_name = entry.name
+        # Bind hot attributes once: the wrapper body then runs on locals.
+        merged_config = self._merged_config
+        output = self._output
+        format_args = self._format_args
+        perf_counter_ns = time.perf_counter_ns
 
         def logged_wrapper(*args, **kwargs):
-            # Get merged configuration at runtime (dynamic config)
-            cfg = self.get_config(handler_name)
+            # Get merged configuration at runtime (dynamic config, cached
+            # per method until the next configure update)
+            cfg = merged_config(handler_name)
 
             # If disabled for this method, return passthrough
             if not cfg.get("enabled", True):
@@ -204,11 +251,17 @@ class LoggingPlugin(BasePlugin):
 
             # Log before call
             if cfg.get("before"):
-                args_str = self._format_args(args, kwargs)
-                self._output(f"→ {handler_name}({args_str})", cfg=cfg)
+                args_str = format_args(args, kwargs)
+                output(f"→ {handler_name}({args_str})", "info", cfg)
+
+            # Fast path: with neither 'after' nor 'time' enabled there is
+            # nothing left to do once the handler returns, so skip the
+            # try/except/finally bookkeeping entirely (trace-only mode).
+            if not cfg.get("after") and not cfg.get("time"):
+                return call_next(*args, **kwargs)
 
             # Execute handler with optional timing
-            start_time = time.time() if cfg.get("time") else None
+            start_time = perf_counter_ns() if cfg.get("time") else None
             exception = None
             result = None
 
@@ -220,20 +273,20 @@ class LoggingPlugin(BasePlugin):
                 if cfg.get("after"):
                     time_str = ""
                     if start_time is not None:
-                        elapsed = time.time() - start_time
+                        elapsed = (perf_counter_ns() - start_time) / 1e9
                         time_str = f" ({elapsed:.4f}s)"
                     exc_type = type(e).__name__
                     msg = f"✗ {handler_name}() raised {exc_type}: {e}{time_str}"
-                    self._output(msg, level="error", cfg=cfg)
+                    output(msg, "error", cfg)
                 raise
             finally:
                 # Log after call (if no exception)
                 if exception is None and cfg.get("after"):
                     time_str = ""
                     if start_time is not None:
-                        elapsed = time.time() - start_time
+                        elapsed = (perf_counter_ns() - start_time) / 1e9
                         time_str = f" ({elapsed:.4f}s)"
-                    self._output(f"← {handler_name}() → {result}{time_str}", cfg=cfg)
+                    output(f"← {handler_name}() → {result}{time_str}", "info", cfg)
 
             return result
 
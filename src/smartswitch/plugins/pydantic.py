@@ -13,8 +13,10 @@ MVP Support:
 
 from __future__ import annotations
 
+import functools
 import inspect
-from typing import TYPE_CHECKING, Any, Callable, Optional, get_type_hints
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, get_origin, get_type_hints
 
 try:
     from pydantic import BaseModel, ValidationError, create_model
@@ -29,6 +31,74 @@ if TYPE_CHECKING:
 from ..core import BasePlugin
 
 
+@functools.lru_cache(maxsize=None)
+def _signature(func: Callable) -> inspect.Signature:
+    """Cached inspect.signature: keyed on function identity.
+
+    The same function may be decorated by several Switchers (or re-decorated
+    in tests); signature construction is the expensive part and its result
+    never changes for a given function object.
+    """
+    return inspect.signature(func)
+
+
+@functools.lru_cache(maxsize=None)
+def _type_hints(func: Callable) -> dict:
+    """Cached typing.get_type_hints: keyed on function identity.
+
+    Hint resolution walks the MRO and evaluates string annotations (~tens
+    of microseconds per call); for a given function object the result never
+    changes. Callers must not mutate the returned dict.
+    """
+    return get_type_hints(func)
+
+
+# Models shared across functions with identical field shapes, keyed on the
+# (name, hint, default) tuples. Two handlers taking e.g. (items: list[int])
+# then compile a single schema between them.
+_shared_models: Dict[tuple, type] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _validation_model(func: Callable) -> type:
+    """Cached validation-model builder: keyed on function identity.
+
+    create_model() compiles a pydantic-core schema, by far the most
+    expensive step of decoration. The model depends only on the function's
+    hints and defaults, so when the same function is decorated by several
+    Switchers the compiled model is reused.
+    """
+    hints = dict(_type_hints(func))
+    hints.pop("return", None)
+    sig = _signature(func)
+    fields = {}
+
+    for param_name, hint in hints.items():
+        param = sig.parameters.get(param_name)
+        if param is None or param.default is inspect.Parameter.empty:
+            # Not in signature (shouldn't happen) or required parameter
+            fields[param_name] = (hint, ...)
+        else:
+            # Optional parameter with default
+            fields[param_name] = (hint, param.default)
+
+    try:
+        key = tuple(fields.items())
+        hash(key)
+    except TypeError:
+        # Unhashable default somewhere: fall back to a private model
+        return create_model(  # type: ignore[call-overload, no-any-return]
+            f"{func.__name__}_Model", **fields
+        )
+
+    model = _shared_models.get(key)
+    if model is None:
+        model = _shared_models[key] = create_model(  # type: ignore[call-overload]
+            f"{func.__name__}_Model", **fields
+        )
+    return model
+
+
 class PydanticPlugin(BasePlugin):
     """
     Plugin that adds Pydantic validation to handlers based on type hints.
@@ -72,9 +142,9 @@ class PydanticPlugin(BasePlugin):
             func: The handler function being decorated
             entry: The method entry with metadata
         """
-        # Get type hints (resolved with string annotations)
+        # Get type hints (resolved with string annotations, cached per function)
         try:
-            hints = get_type_hints(func)
+            hints = dict(_type_hints(func))
         except Exception:
             # If type hints can't be resolved, skip validation
             entry.metadata["pydantic"] = {"enabled": False}
@@ -88,24 +158,11 @@ class PydanticPlugin(BasePlugin):
             entry.metadata["pydantic"] = {"enabled": False}
             return
 
-        # Get function signature
-        sig = inspect.signature(func)
-        fields = {}
-
-        for param_name, hint in hints.items():
-            param = sig.parameters.get(param_name)
-            if param is None:
-                # Parameter not in signature (shouldn't happen)
-                fields[param_name] = (hint, ...)
-            elif param.default is inspect.Parameter.empty:
-                # Required parameter
-                fields[param_name] = (hint, ...)
-            else:
-                # Optional parameter with default
-                fields[param_name] = (hint, param.default)
+        # Get function signature (cached per function object)
+        sig = _signature(func)
 
-        # Create validation model
-        validation_model = create_model(f"{func.__name__}_Model", **fields)  # type: ignore[call-overload]
+        # Build (or reuse) the validation model for this function
+        validation_model = _validation_model(func)
 
         # Pre-extract ALL information needed for CLI/API/Help (one-time extraction)
         # This avoids repeated inspect.signature() calls throughout the application
@@ -116,15 +173,13 @@ class PydanticPlugin(BasePlugin):
             if param_name == "self":
                 continue
 
-            param_names.append(param_name)
+            param_names.append(sys.intern(param_name))
 
             # Extract type info
             hint = hints.get(param_name)
             if hint is not None:
                 # Try to get a clean type name
                 try:
-                    from typing import get_origin
-
                     origin = get_origin(hint)
                     if origin is not None:
                         param_type = str(hint)
@@ -187,47 +242,125 @@ class PydanticPlugin(BasePlugin):
         validation_model = pydantic_meta["model"]
         hints = pydantic_meta["hints"]
         sig = pydantic_meta["signature"]
+        # Title of the re-raised error: formatted once, not per failure
+        error_title = f"Validation error in {entry.name}"
+        # When every parameter is hinted (the common case) the hinted/
+        # unhinted split below is a no-op, so skip the two dict builds.
+        all_hinted = all(name in hints for name in sig.parameters)
+        # Fully scalar-hinted signatures can skip pydantic when every
+        # argument already has the exact hinted type (exact match, so a
+        # bool passed for an int still takes the validation path).
+        scalar_only = all_hinted and all(hint in (int, float, bool, str) for hint in hints.values())
+        # Params hinted as BaseModel subclasses: an argument that already is
+        # an instance of its hinted model needs no revalidation.
+        model_params = {
+            name: hint
+            for name, hint in hints.items()
+            if isinstance(hint, type) and issubclass(hint, BaseModel)
+        }
+        # Simple signatures (positional-or-keyword only, no *args/**kwargs)
+        # can be bound with plain dict operations instead of sig.bind(),
+        # which costs several microseconds per call.
+        simple_bind = all(
+            p.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD for p in sig.parameters.values()
+        )
+        # Interned names: the bind dict and kwargs expansion below then
+        # compare keys by pointer.
+        param_names = tuple(sys.intern(name) for name in sig.parameters)
+        param_set = frozenset(param_names)
+        defaults = {
+            name: p.default
+            for name, p in sig.parameters.items()
+            if p.default is not inspect.Parameter.empty
+        }
 
         def wrapper(*args, **kwargs):
             """Validate arguments before calling function."""
-            # Build dict of all arguments
-            try:
+            # Build dict of all arguments: manual binding first, falling
+            # back to Signature.bind for irregular calls (which also owns
+            # raising the proper TypeError on a genuinely bad call).
+            arguments = None
+            if simple_bind and len(args) <= len(param_names):
+                arguments = dict(zip(param_names, args))
+                if kwargs:
+                    if kwargs.keys() & arguments.keys() or not kwargs.keys() <= param_set:
+                        arguments = None
+                    else:
+                        arguments.update(kwargs)
+                if arguments is not None and len(arguments) < len(param_names):
+                    for name in param_names:
+                        if name not in arguments:
+                            if name in defaults:
+                                arguments[name] = defaults[name]
+                            else:
+                                arguments = None
+                                break
+            if arguments is None:
                 bound = sig.bind(*args, **kwargs)
                 bound.apply_defaults()
-            except TypeError:
-                # Signature binding failed - let it propagate
-                raise
+                arguments = bound.arguments
 
             # Split arguments into those with hints and those without
-            args_to_validate = {k: v for k, v in bound.arguments.items() if k in hints}
-            args_without_hints = {k: v for k, v in bound.arguments.items() if k not in hints}
+            if all_hinted:
+                args_to_validate = arguments
+                args_without_hints = {}
+            else:
+                args_to_validate = {k: v for k, v in arguments.items() if k in hints}
+                args_without_hints = {k: v for k, v in arguments.items() if k not in hints}
+
+            # Fast path: exact-type scalar arguments need no coercion, so
+            # the pydantic round-trip would return them unchanged.
+            if scalar_only:
+                for name, value in args_to_validate.items():
+                    if type(value) is not hints[name]:
+                        break
+                else:
+                    return call_next(**args_to_validate)
+
+            # Fast path: when every hinted argument is already an instance
+            # of its hinted model there is nothing left to validate, so
+            # skip the model round-trip entirely (dict inputs still take
+            # the full validation path below).
+            if model_params and all(
+                name in model_params and isinstance(value, model_params[name])
+                for name, value in args_to_validate.items()
+            ):
+                final_args = dict(args_without_hints)
+                final_args.update(args_to_validate)
+                return call_next(**final_args)
 
-            # Validate using Pydantic
+            # Validate using Pydantic. Only the validation call sits in the
+            # try block: the merge loop and the handler itself run outside
+            # it, so a ValidationError raised by the handler propagates
+            # as-is instead of being rewrapped with this entry's title.
             try:
                 validated = validation_model(**args_to_validate)
-
-                # Merge validated args with unvalidated args
-                # For BaseModel instances, keep the validated object, not the dict
-                final_args = args_without_hints.copy()
-                for key, value in validated:
-                    # Check if original input was already a BaseModel instance
-                    original_value = args_to_validate.get(key)
-                    if isinstance(original_value, BaseModel):
-                        # Keep the original BaseModel instance
-                        final_args[key] = original_value
-                    else:
-                        # Use validated value
-                        final_args[key] = value
-
-                # Call next layer with validated arguments
-                return call_next(**final_args)
             except ValidationError as e:
-                # Re-raise with more context
+                # Re-raise with more context; e.errors() is materialized
+                # exactly once, on the failure path only
                 raise ValidationError.from_exception_data(
-                    title=f"Validation error in {entry.name}",
+                    title=error_title,
                     line_errors=e.errors(),
                 ) from e
 
+            # Merge validated args with unvalidated args
+            # For BaseModel instances, keep the validated object, not the dict
+            # (__dict__ holds the validated field values; reading it skips
+            # the field-iteration protocol of BaseModel.__iter__)
+            final_args = args_without_hints.copy()
+            for key, value in validated.__dict__.items():
+                # Check if original input was already a BaseModel instance
+                original_value = args_to_validate.get(key)
+                if isinstance(original_value, BaseModel):
+                    # Keep the original BaseModel instance
+                    final_args[key] = original_value
+                else:
+                    # Use validated value
+                    final_args[key] = value
+
+            # Call next layer with validated arguments
+            return call_next(**final_args)
+
         return wrapper
 
 
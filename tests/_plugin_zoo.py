@@ -0,0 +1,24 @@
+"""Pre-built plugin classes shared across test modules.
+
+Defining these once at import time saves a class creation per test and
+keeps the identity wrap_handler as a single shared function object.
+"""
+
+from __future__ import annotations
+
+from smartswitch import BasePlugin
+
+
+class IdentityPlugin(BasePlugin):
+    """Plugin whose wrap_handler is a passthrough."""
+
+    def wrap_handler(self, switch, entry, call_next):
+        return call_next
+
+
+class IdentityPluginA(IdentityPlugin):
+    """Distinct identity plugin type, for tests that need two plugins."""
+
+
+class IdentityPluginB(IdentityPlugin):
+    """Distinct identity plugin type, for tests that need two plugins."""
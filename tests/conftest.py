@@ -0,0 +1,51 @@
+"""Shared fixtures for the SmartSwitch test suite."""
+
+from __future__ import annotations
+
+import pytest
+
+from smartswitch import BasePlugin, Switcher
+
+
+def _identity_wrap(self, switch, entry, call_next):
+    return call_next
+
+
+@pytest.fixture(autouse=True)
+def _isolate_plugin_registry():
+    """Snapshot and restore the global plugin registry around each test.
+
+    Switcher.register_plugin mutates a process-global dict, so names
+    registered by one test (e.g. 'flag', 'testplugin') would otherwise leak
+    into every test that runs afterwards.
+    """
+    snapshot = dict(Switcher._global_plugin_registry)
+    yield
+    Switcher._global_plugin_registry.clear()
+    Switcher._global_plugin_registry.update(snapshot)
+
+
+@pytest.fixture(scope="session")
+def make_plugin():
+    """Factory for throwaway BasePlugin subclasses.
+
+    Builds a plugin class with an identity wrap_handler (shared function
+    object, so tests don't redefine the same boilerplate), overridable via
+    keyword namespace entries: make_plugin("Tracker", on_decore=...).
+    """
+
+    def _make(cls_name="IdentityPlugin", **namespace):
+        namespace.setdefault("wrap_handler", _identity_wrap)
+        return type(cls_name, (BasePlugin,), namespace)
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def not_a_plugin_cls():
+    """A class that is not a BasePlugin subclass, created once per session."""
+
+    class NotAPlugin:
+        pass
+
+    return NotAPlugin
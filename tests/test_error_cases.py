@@ -6,84 +6,64 @@ These tests target uncovered error paths to improve coverage.
 
 from __future__ import annotations
 
-import unittest
+import pytest
+from _plugin_zoo import IdentityPlugin, IdentityPluginA, IdentityPluginB
 
-from smartswitch import BasePlugin, Switcher
+from smartswitch import Switcher
 
 
-class TestPluginErrorHandling(unittest.TestCase):
-    """Test error handling in plugin registration."""
-
-    def test_register_non_plugin_class(self):
-        """Test that registering non-BasePlugin class raises TypeError."""
-
-        class NotAPlugin:
-            pass
-
-        with self.assertRaises(TypeError) as cm:
-            Switcher.register_plugin("invalid", NotAPlugin)
-
-        self.assertIn("BasePlugin subclass", str(cm.exception))
-
-    def test_plug_with_unknown_plugin_name(self):
-        """Test that plug() with unknown name raises ValueError."""
-        sw = Switcher()
+def _child_name_collision(sw):
+    sw.add_child(Switcher("child"), name="duplicate")
+    sw.add_child(Switcher("another"), name="duplicate")
 
-        # String that is not a registered plugin name
-        with self.assertRaises(ValueError) as cm:
-            sw.plug("not_a_plugin")
 
-        self.assertIn("Unknown plugin name", str(cm.exception))
+class TestPluginErrorHandling:
+    """Test error handling in plugin registration."""
 
-    def test_plug_with_invalid_class(self):
-        """Test that plug() with non-plugin class raises TypeError."""
+    @pytest.mark.parametrize(
+        "invoke, exc, needle",
+        [
+            (
+                lambda sw, bad: Switcher.register_plugin("invalid", bad),
+                TypeError,
+                "BasePlugin subclass",
+            ),
+            (lambda sw, bad: sw.plug("not_a_plugin"), ValueError, "Unknown plugin name"),
+            (lambda sw, bad: sw.plug(bad), TypeError, "BasePlugin"),
+        ],
+        ids=["register-non-plugin-class", "plug-unknown-name", "plug-invalid-class"],
+    )
+    def test_invalid_plugin_usage(self, not_a_plugin_cls, invoke, exc, needle):
+        """Registering or plugging anything that is not a plugin fails."""
         sw = Switcher()
+        with pytest.raises(exc, match=needle):
+            invoke(sw, not_a_plugin_cls)
 
-        class NotAPlugin:
-            pass
-
-        with self.assertRaises(TypeError) as cm:
-            sw.plug(NotAPlugin)
 
-        self.assertIn("BasePlugin", str(cm.exception))
-
-
-class TestSwitcherChildErrors(unittest.TestCase):
+class TestSwitcherChildErrors:
     """Test error handling in child switch management."""
 
-    def test_get_nonexistent_child(self):
-        """Test that getting nonexistent child raises KeyError."""
+    @pytest.mark.parametrize(
+        "invoke, exc, needle",
+        [
+            (
+                lambda sw: sw.get_child("nonexistent"),
+                KeyError,
+                "No child switch named 'nonexistent'",
+            ),
+            (lambda sw: sw.add_child(sw), ValueError, "Cannot attach a switch to itself"),
+            (_child_name_collision, ValueError, "Child name collision"),
+        ],
+        ids=["get-nonexistent-child", "add-switch-to-itself", "child-name-collision"],
+    )
+    def test_child_management_errors(self, invoke, exc, needle):
+        """Invalid child lookups and attachments fail with clear messages."""
         sw = Switcher("parent")
+        with pytest.raises(exc, match=needle):
+            invoke(sw)
 
-        with self.assertRaises(KeyError) as cm:
-            sw.get_child("nonexistent")
-
-        self.assertIn("No child switch named 'nonexistent'", str(cm.exception))
 
-    def test_add_switch_to_itself(self):
-        """Test that adding switch to itself raises ValueError."""
-        sw = Switcher("self")
-
-        with self.assertRaises(ValueError) as cm:
-            sw.add_child(sw)
-
-        self.assertIn("Cannot attach a switch to itself", str(cm.exception))
-
-    def test_child_name_collision(self):
-        """Test that duplicate child name raises ValueError."""
-        parent = Switcher("parent")
-        child1 = Switcher("child")
-        child2 = Switcher("another")
-
-        parent.add_child(child1, name="duplicate")
-
-        with self.assertRaises(ValueError) as cm:
-            parent.add_child(child2, name="duplicate")
-
-        self.assertIn("Child name collision", str(cm.exception))
-
-
-class TestSwitcherMethods(unittest.TestCase):
+class TestSwitcherMethods:
     """Test uncovered Switcher methods."""
 
     def test_describe(self):
@@ -96,178 +76,117 @@ class TestSwitcherMethods(unittest.TestCase):
 
         desc = sw.describe()
 
-        self.assertEqual(desc["name"], "test")
-        self.assertIn("methods", desc)
-        self.assertIn("handler", desc["methods"])
-        self.assertIn("children", desc)
-        self.assertIn("plugins", desc)
+        assert desc["name"] == "test"
+        # One subset check instead of three separate membership assertions
+        assert {"methods", "children", "plugins"} <= desc.keys()
+        assert "handler" in desc["methods"]
 
-    def test_plugin_to_spec(self):
+    def test_plugin_to_spec(self, make_plugin):
         """Test plugin to_spec() method."""
-
-        class TestPlugin(BasePlugin):
-            def wrap_handler(self, switch, entry, call_next):
-                return call_next
-
-        plugin = TestPlugin(name="test", custom_param="value")
+        plugin_cls = make_plugin("SpecPlugin")
+        plugin = plugin_cls(name="test", custom_param="value")
         spec = plugin.to_spec()
 
-        self.assertEqual(spec.factory, TestPlugin)
-        self.assertEqual(spec.plugin_name, "test")
-        self.assertEqual(spec.kwargs["custom_param"], "value")
+        assert spec.factory is plugin_cls
+        assert spec.plugin_name == "test"
+        assert spec.kwargs["custom_param"] == "value"
 
     def test_registered_plugins(self):
         """Test registered_plugins() returns dict."""
         registry = Switcher.registered_plugins()
 
-        self.assertIsInstance(registry, dict)
+        assert isinstance(registry, dict)
         # Should have at least 'logging' plugin registered
-        self.assertIn("logging", registry)
+        assert "logging" in registry
 
     def test_iter_plugins_empty(self):
         """Test iter_plugins() on Switcher without plugins."""
         sw = Switcher()
 
-        plugins = list(sw.iter_plugins())
-        self.assertEqual(len(plugins), 0)
+        assert next(iter(sw.iter_plugins()), None) is None
 
     def test_iter_plugins_with_plugins(self):
         """Test iter_plugins() returns all plugins."""
-
-        class Plugin1(BasePlugin):
-            def wrap_handler(self, switch, entry, call_next):
-                return call_next
-
-        class Plugin2(BasePlugin):
-            def wrap_handler(self, switch, entry, call_next):
-                return call_next
-
         sw = Switcher()
-        sw.plug(Plugin1, name="p1")
-        sw.plug(Plugin2, name="p2")
+        sw.plug(IdentityPluginA, name="p1")
+        sw.plug(IdentityPluginB, name="p2")
 
-        plugins = list(sw.iter_plugins())
-        self.assertEqual(len(plugins), 2)
-        names = [p.name for p in plugins]
-        self.assertIn("p1", names)
-        self.assertIn("p2", names)
+        names = {p.name for p in sw.iter_plugins()}
+        assert names == {"p1", "p2"}
 
 
-class TestPluginConfiguration(unittest.TestCase):
+class TestPluginConfiguration:
     """Test plugin configuration methods."""
 
     def test_plugin_config_update(self):
         """Test that plugging instance updates its config."""
-
-        class ConfigPlugin(BasePlugin):
-            def wrap_handler(self, switch, entry, call_next):
-                return call_next
-
         # Create plugin with initial config
-        plugin = ConfigPlugin(name="test", param1="value1")
-        self.assertEqual(plugin.config["param1"], "value1")
+        plugin = IdentityPlugin(name="test", param1="value1")
+        assert plugin.config["param1"] == "value1"
 
         # Plug it with additional config
         sw = Switcher()
         sw.plug(plugin, param2="value2")
 
         # Config should be updated
-        self.assertEqual(plugin.config["param1"], "value1")
-        self.assertEqual(plugin.config["param2"], "value2")
-
-
-class TestSwitcherParentErrors(unittest.TestCase):
-    """Test error handling for parent-related methods."""
-
-    def test_use_parent_plugins_no_parent(self):
-        """Test use_parent_plugins() raises ValueError when no parent."""
-        sw = Switcher()  # No parent
-
-        with self.assertRaises(ValueError) as cm:
-            sw.use_parent_plugins()
-
-        self.assertIn("no parent", str(cm.exception))
-
-    def test_copy_plugins_from_parent_no_parent(self):
-        """Test copy_plugins_from_parent() raises ValueError when no parent."""
-        sw = Switcher()  # No parent
-
-        with self.assertRaises(ValueError) as cm:
-            sw.copy_plugins_from_parent()
-
-        self.assertIn("no parent", str(cm.exception))
-
+        assert plugin.config["param1"] == "value1"
+        assert plugin.config["param2"] == "value2"
 
-class TestSwitcherAttributeErrors(unittest.TestCase):
-    """Test AttributeError handling for plugin access."""
 
-    def test_getattr_plugin_not_found(self):
-        """Test that accessing non-existent plugin raises AttributeError."""
-        sw = Switcher()
-
-        with self.assertRaises(AttributeError) as cm:
-            _ = sw.nonexistent_plugin
-
-        # Check error message contains key info
-        self.assertIn("no attribute", str(cm.exception))
-        self.assertIn("nonexistent_plugin", str(cm.exception))
-
-
-class TestSwitcherCallErrors(unittest.TestCase):
-    """Test TypeError handling for invalid __call__ usage."""
-
-    def test_call_with_string_and_extra_args(self):
-        """Test that calling with string + extra args raises TypeError."""
-        sw = Switcher()
-
-        with self.assertRaises(TypeError) as cm:
-            sw("handler", "extra")  # Extra positional arg
-
-        self.assertIn("supports only decorator usage", str(cm.exception))
+# The remaining error tests are module-level functions: the former classes
+# were pure namespacing (no fixtures or shared state), and pytest builds a
+# fresh class instance per test method for no benefit.
 
-    def test_call_with_string_and_kwargs(self):
-        """Test that calling with string + kwargs raises TypeError."""
-        sw = Switcher()
 
-        with self.assertRaises(TypeError) as cm:
-            sw("handler", key="value")
+def test_use_parent_plugins_no_parent():
+    """use_parent_plugins() raises ValueError when there is no parent."""
+    sw = Switcher()
 
-        self.assertIn("supports only decorator usage", str(cm.exception))
+    with pytest.raises(ValueError, match="no parent"):
+        sw.use_parent_plugins()
 
-    def test_call_with_non_callable_non_string(self):
-        """Test that calling with non-callable, non-string raises TypeError."""
-        sw = Switcher()
 
-        with self.assertRaises(TypeError) as cm:
-            sw(123)  # Not callable, not string
+def test_copy_plugins_from_parent_no_parent():
+    """copy_plugins_from_parent() raises ValueError when there is no parent."""
+    sw = Switcher()
 
-        self.assertIn("supports only decorator usage", str(cm.exception))
+    with pytest.raises(ValueError, match="no parent"):
+        sw.copy_plugins_from_parent()
 
 
-class TestSwitcherDispatchErrors(unittest.TestCase):
-    """Test dispatch error handling."""
+def test_getattr_plugin_not_found():
+    """Accessing a non-existent plugin raises AttributeError."""
+    sw = Switcher()
 
-    def test_dispatch_unknown_method(self):
-        """Test that getting unknown handler raises NotImplementedError."""
-        sw = Switcher()
+    with pytest.raises(AttributeError, match="no attribute 'nonexistent_plugin'"):
+        _ = sw.nonexistent_plugin
 
-        # Try to get non-existent handler
-        with self.assertRaises(NotImplementedError) as cm:
-            sw.get("nonexistent_handler")
 
-        self.assertIn("not found", str(cm.exception))
-        self.assertIn("nonexistent_handler", str(cm.exception))
+@pytest.mark.parametrize(
+    "invoke",
+    [
+        lambda sw: sw("handler", "extra"),  # string + extra positional arg
+        lambda sw: sw("handler", key="value"),  # string + kwargs
+        lambda sw: sw(123),  # not callable, not string
+    ],
+    ids=["string-and-extra-args", "string-and-kwargs", "non-callable-non-string"],
+)
+def test_call_invalid_usage(invoke):
+    """Invalid __call__ usage raises TypeError."""
+    sw = Switcher()
 
+    with pytest.raises(TypeError, match="supports only decorator usage"):
+        invoke(sw)
 
-class TestIterUnboundSwitchersEdgeCases(unittest.TestCase):
-    """Test edge cases in _iter_unbound_switchers."""
 
-    def test_iter_unbound_switchers_with_none(self):
-        """Test _iter_unbound_switchers returns empty when source is None."""
-        result = list(Switcher._iter_unbound_switchers(None))
+def test_dispatch_unknown_method():
+    """Getting an unknown handler raises NotImplementedError."""
+    sw = Switcher()
 
-        self.assertEqual(result, [])
+    with pytest.raises(NotImplementedError, match="'nonexistent_handler' not found"):
+        sw.get("nonexistent_handler")
 
 
-if __name__ == "__main__":
-    unittest.main()
+def test_iter_unbound_switchers_with_none():
+    """_iter_unbound_switchers returns empty when source is None."""
+    assert list(Switcher._iter_unbound_switchers(None)) == []
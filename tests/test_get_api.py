@@ -11,7 +11,7 @@ This test module covers the SmartAsync integration (#25) features:
 
 import unittest
 
-from smartswitch import Switcher
+from smartswitch import BasePlugin, Switcher
 
 
 class TestGetMethod(unittest.TestCase):
@@ -96,8 +96,6 @@ class TestGetMethod(unittest.TestCase):
         call_count = []
 
         # Simple plugin that counts calls
-        from smartswitch import BasePlugin
-
         class CountPlugin(BasePlugin):
             def wrap_handler(self, switch, entry, call_next):
                 def wrapper(*args, **kwargs):
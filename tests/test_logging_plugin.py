@@ -13,6 +13,20 @@ from smartswitch import Switcher
 from smartswitch.plugins import LoggingPlugin
 
 
+@pytest.fixture
+def logged_switcher():
+    """Factory for a Switcher with the logging plugin plugged.
+
+    Centralizes the plug("logging", flags=...) construction that almost
+    every test in this module repeats.
+    """
+
+    def _make(flags, **config):
+        return Switcher().plug("logging", flags=flags, **config)
+
+    return _make
+
+
 class TestModeValidation:
     """Test mode flag parsing and validation."""
 
@@ -27,74 +41,44 @@ class TestModeValidation:
         assert plugin._global_config["after"] is False  # Default: hide output
         assert plugin._global_config["time"] is False
 
-    def test_print_mode(self):
-        """Test explicit print mode."""
-        plugin = LoggingPlugin(flags="print,enabled")
-        cfg = plugin._global_config
-        assert cfg["print"] is True
-        assert cfg["log"] is True  # Both can be True (print overrides)
-        assert cfg["enabled"] is True
-        assert cfg["before"] is True  # Default
-        assert cfg["after"] is False  # Default
-
-    def test_log_mode(self):
-        """Test log mode."""
-        plugin = LoggingPlugin(flags="log,enabled")
-        cfg = plugin._global_config
-        assert cfg["print"] is False
-        assert cfg["log"] is True
-        assert cfg["enabled"] is True
-        assert cfg["before"] is True  # Default
-        assert cfg["after"] is False  # Default
-
-    def test_before_flag(self):
-        """Test before flag only."""
-        plugin = LoggingPlugin(flags="print,enabled,before")
-        cfg = plugin._global_config
-        assert cfg["before"] is True
-        assert cfg["after"] is False
-        assert cfg["time"] is False
-
-    def test_after_flag(self):
-        """Test after flag only (must disable before explicitly)."""
-        plugin = LoggingPlugin(flags="print,enabled,before:off,after")
-        cfg = plugin._global_config
-        assert cfg["before"] is False
-        assert cfg["after"] is True
-        assert cfg["time"] is False
-
-    def test_time_flag(self):
-        """Test time flag with defaults."""
-        plugin = LoggingPlugin(flags="print,enabled,time")
-        cfg = plugin._global_config
-        assert cfg["before"] is True  # Default
-        assert cfg["after"] is False  # Default (not enabled by time flag)
-        assert cfg["time"] is True
-
-    def test_combined_flags(self):
-        """Test combination of flags."""
-        plugin = LoggingPlugin(flags="log,enabled,before,after,time")
-        cfg = plugin._global_config
-        assert cfg["log"] is True
-        assert cfg["before"] is True
-        assert cfg["after"] is True
-        assert cfg["time"] is True
-
-    def test_whitespace_handling(self):
-        """Test flags with whitespace."""
-        plugin = LoggingPlugin(flags=" print,enabled , after , time ")
-        cfg = plugin._global_config
-        assert cfg["print"] is True
-        assert cfg["after"] is True
-        assert cfg["time"] is True
+    @pytest.mark.parametrize(
+        "flags, expected",
+        [
+            # print mode: both outputs can be True (print overrides)
+            (
+                "print,enabled",
+                {"print": True, "log": True, "enabled": True, "before": True, "after": False},
+            ),
+            (
+                "log,enabled",
+                {"print": False, "log": True, "enabled": True, "before": True, "after": False},
+            ),
+            ("print,enabled,before", {"before": True, "after": False, "time": False}),
+            # after only: 'before' must be disabled explicitly
+            ("print,enabled,before:off,after", {"before": False, "after": True, "time": False}),
+            # time flag does not enable 'after'
+            ("print,enabled,time", {"before": True, "after": False, "time": True}),
+            (
+                "log,enabled,before,after,time",
+                {"log": True, "before": True, "after": True, "time": True},
+            ),
+            (" print,enabled , after , time ", {"print": True, "after": True, "time": True}),
+        ],
+        ids=["print-mode", "log-mode", "before", "after", "time", "combined", "whitespace"],
+    )
+    def test_flag_parsing(self, flags, expected):
+        """Each flags string yields the expected global config values."""
+        cfg = LoggingPlugin(flags=flags)._global_config
+        for key, value in expected.items():
+            assert cfg[key] is value
 
 
 class TestPrintOutput:
     """Test output using print()."""
 
-    def test_print_default(self, capsys):
+    def test_print_default(self, capsys, logged_switcher):
         """Test default print output shows only before (default)."""
-        sw = Switcher().plug("logging", flags="print,enabled")
+        sw = logged_switcher("print,enabled")
 
         @sw
         def add(a, b):
@@ -108,9 +92,9 @@ class TestPrintOutput:
         # Default: after is False, so no output line
         assert "← add()" not in captured.out
 
-    def test_print_before_only(self, capsys):
+    def test_print_before_only(self, capsys, logged_switcher):
         """Test print with only before flag."""
-        sw = Switcher().plug("logging", flags="print,enabled,before")
+        sw = logged_switcher("print,enabled,before")
 
         @sw
         def process(data):
@@ -122,9 +106,9 @@ class TestPrintOutput:
         assert "→ process('test')" in captured.out
         assert "← process()" not in captured.out
 
-    def test_print_after_only(self, capsys):
+    def test_print_after_only(self, capsys, logged_switcher):
         """Test print with only after flag (disable before explicitly)."""
-        sw = Switcher().plug("logging", flags="print,enabled,before:off,after")
+        sw = logged_switcher("print,enabled,before:off,after")
 
         @sw
         def process(data):
@@ -136,9 +120,9 @@ class TestPrintOutput:
         assert "→ process(" not in captured.out  # Before disabled
         assert "← process() → processed-test" in captured.out
 
-    def test_print_with_time(self, capsys):
+    def test_print_with_time(self, capsys, logged_switcher):
         """Test print with timing."""
-        sw = Switcher().plug("logging", flags="print,enabled,after,time")
+        sw = logged_switcher("print,enabled,after,time")
 
         @sw
         def slow():
@@ -151,9 +135,9 @@ class TestPrintOutput:
         assert "← slow() → done" in captured.out
         assert "s)" in captured.out  # Has timing
 
-    def test_print_kwargs(self, capsys):
+    def test_print_kwargs(self, capsys, logged_switcher):
         """Test print with keyword arguments."""
-        sw = Switcher().plug("logging", flags="print,enabled,before")
+        sw = logged_switcher("print,enabled,before")
 
         @sw
         def create_user(name, age, email=""):
@@ -18,23 +18,62 @@ from pydantic import BaseModel, ValidationError  # noqa: E402
 from smartswitch import Switcher  # noqa: E402
 
 
+@pytest.fixture(scope="session")
+def pydantic_switcher():
+    """Factory for fresh Switchers with the pydantic plugin plugged.
+
+    The plugin module import (lazy by default) is pre-warmed once per
+    session; each call still builds a new Switcher, since decorating
+    handlers mutates it.
+    """
+    Switcher().plug("pydantic")
+
+    def _make(**kwargs):
+        return Switcher(**kwargs).plug("pydantic")
+
+    return _make
+
+
+class TestLazyExports:
+    """Test the PEP 562 lazy export of PydanticPlugin."""
+
+    def test_lazy_attribute_resolves_plugin(self):
+        """Both package __getattr__ hooks resolve the same plugin class."""
+        import smartswitch
+        import smartswitch.plugins as plugins
+
+        assert smartswitch.PydanticPlugin is plugins.PydanticPlugin
+        assert "PydanticPlugin" in smartswitch.__all__
+        assert "PydanticPlugin" in plugins.__all__
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names still raise AttributeError through __getattr__."""
+        import smartswitch
+        import smartswitch.plugins as plugins
+
+        with pytest.raises(AttributeError, match="no_such_export"):
+            smartswitch.no_such_export
+        with pytest.raises(AttributeError, match="no_such_export"):
+            plugins.no_such_export
+
+
 class TestPydanticPluginBasics:
     """Basic PydanticPlugin functionality tests."""
 
-    def test_plugin_registration(self):
+    def test_plugin_registration(self, pydantic_switcher):
         """Test that pydantic plugin can be registered."""
-        sw = Switcher(name="test").plug("pydantic")
+        sw = pydantic_switcher(name="test")
         assert len(list(sw.iter_plugins())) == 1
 
-    def test_plugin_chaining(self):
+    def test_plugin_chaining(self, pydantic_switcher):
         """Test that plug() returns self for chaining."""
-        sw = Switcher(name="api").plug("pydantic")
+        sw = pydantic_switcher(name="api")
         assert isinstance(sw, Switcher)
         assert sw.name == "api"
 
-    def test_basic_type_validation(self):
+    def test_basic_type_validation(self, pydantic_switcher):
         """Test basic type validation with simple types."""
-        sw = Switcher().plug("pydantic")
+        sw = pydantic_switcher()
 
         @sw
         def add_numbers(x: int, y: int) -> int:
@@ -56,9 +95,9 @@ class TestPydanticPluginBasics:
 class TestPydanticBasicTypes:
     """Test validation of basic Python types."""
 
-    def test_string_validation(self):
+    def test_string_validation(self, pydantic_switcher):
         """Test string type validation."""
-        sw = Switcher().plug("pydantic")
+        sw = pydantic_switcher()
 
         @sw
         def greet(name: str) -> str:
@@ -69,9 +108,9 @@ class TestPydanticBasicTypes:
         with pytest.raises(ValidationError):
             sw["greet"](123)
 
-    def test_integer_validation(self):
+    def test_integer_validation(self, pydantic_switcher):
         """Test integer type validation."""
-        sw = Switcher().plug("pydantic")
+        sw = pydantic_switcher()
 
         @sw
         def double(x: int) -> int:
@@ -85,9 +124,9 @@ class TestPydanticBasicTypes:
         with pytest.raises(ValidationError):
             sw["double"]("not a number")
 
-    def test_float_validation(self):
+    def test_float_validation(self, pydantic_switcher):
         """Test float type validation."""
-        sw = Switcher().plug("pydantic")
+        sw = pydantic_switcher()
 
         @sw
         def square(x: float) -> float:
@@ -99,9 +138,9 @@ class TestPydanticBasicTypes:
         with pytest.raises(ValidationError):
             sw["square"]("not a number")
 
-    def test_bool_validation(self):
+    def test_bool_validation(self, pydantic_switcher):
         """Test boolean type validation."""
-        sw = Switcher().plug("pydantic")
+        sw = pydantic_switcher()
 
         @sw
         def negate(flag: bool) -> bool:
@@ -114,9 +153,9 @@ class TestPydanticBasicTypes:
 class TestPydanticOptionalAndDefaults:
     """Test Optional types and default values."""
 
-    def test_optional_parameter(self):
+    def test_optional_parameter(self, pydantic_switcher):
         """Test Optional type annotation."""
-        sw = Switcher().plug("pydantic")
+        sw = pydantic_switcher()
 
         @sw
         def greet(name: str, title: Optional[str] = None) -> str:
@@ -130,9 +169,9 @@ class TestPydanticOptionalAndDefaults:
         # Without title
         assert sw["greet"]("Alice") == "Hello, Alice"
 
-    def test_default_values(self):
+    def test_default_values(self, pydantic_switcher):
         """Test parameters with default values."""
-        sw = Switcher().plug("pydantic")
+        sw = pydantic_switcher()
 
         @sw
         def power(x: int, exponent: int = 2) -> int:
@@ -148,9 +187,9 @@ class TestPydanticOptionalAndDefaults:
 class TestPydanticComplexTypes:
     """Test validation of complex types (List, Dict, etc)."""
 
-    def test_list_validation(self):
+    def test_list_validation(self, pydantic_switcher):
         """Test List type validation."""
-        sw = Switcher().plug("pydantic")
+        sw = pydantic_switcher()
 
         @sw
         def sum_numbers(numbers: list[int]) -> int:
@@ -164,9 +203,9 @@ class TestPydanticComplexTypes:
         with pytest.raises(ValidationError):
             sw["sum_numbers"](["a", "b", "c"])
 
-    def test_dict_validation(self):
+    def test_dict_validation(self, pydantic_switcher):
         """Test Dict type validation."""
-        sw = Switcher().plug("pydantic")
+        sw = pydantic_switcher()
 
         @sw
         def get_value(data: dict[str, int], key: str) -> int:
@@ -178,9 +217,9 @@ class TestPydanticComplexTypes:
         with pytest.raises(ValidationError):
             sw["get_value"]({"a": "not an int"}, "a")
 
-    def test_tuple_validation(self):
+    def test_tuple_validation(self, pydantic_switcher):
         """Test Tuple type validation."""
-        sw = Switcher().plug("pydantic")
+        sw = pydantic_switcher()
 
         @sw
         def add_coords(point: tuple[int, int]) -> int:
@@ -192,7 +231,7 @@ class TestPydanticComplexTypes:
 class TestPydanticBaseModel:
     """Test validation with existing Pydantic models."""
 
-    def test_pydantic_model_validation(self):
+    def test_pydantic_model_validation(self, pydantic_switcher):
         """Test using existing Pydantic BaseModel."""
 
         class User(BaseModel):
@@ -200,7 +239,7 @@ class TestPydanticBaseModel:
             age: int
             email: Optional[str] = None
 
-        sw = Switcher().plug("pydantic")
+        sw = pydantic_switcher()
 
         @sw
         def greet_user(user: User) -> str:
@@ -222,9 +261,9 @@ class TestPydanticBaseModel:
 class TestPydanticEdgeCases:
     """Test edge cases and error handling."""
 
-    def test_no_type_hints(self):
+    def test_no_type_hints(self, pydantic_switcher):
         """Test function with no type hints (should not validate)."""
-        sw = Switcher().plug("pydantic")
+        sw = pydantic_switcher()
 
         @sw
         def no_hints(x, y):
@@ -234,9 +273,9 @@ class TestPydanticEdgeCases:
         assert sw["no_hints"](5, 10) == 15
         assert sw["no_hints"]("hello", " world") == "hello world"
 
-    def test_partial_type_hints(self):
+    def test_partial_type_hints(self, pydantic_switcher):
         """Test function with partial type hints."""
-        sw = Switcher().plug("pydantic")
+        sw = pydantic_switcher()
 
         @sw
         def partial(x: int, y) -> int:
@@ -248,9 +287,9 @@ class TestPydanticEdgeCases:
         with pytest.raises(ValidationError):
             sw["partial"]("not a number", 10)
 
-    def test_validation_error_message(self):
+    def test_validation_error_message(self, pydantic_switcher):
         """Test that validation errors have useful messages."""
-        sw = Switcher().plug("pydantic")
+        sw = pydantic_switcher()
 
         @sw
         def strict_int(x: int) -> int:
@@ -301,9 +340,9 @@ class TestPydanticPluginStacking:
 class TestPydanticPluginConfigure:
     """Test BasePlugin configure() functionality with Pydantic."""
 
-    def test_disable_globally(self):
+    def test_disable_globally(self, pydantic_switcher):
         """Test disabling validation globally via configure()."""
-        sw = Switcher().plug("pydantic")
+        sw = pydantic_switcher()
 
         @sw
         def strict_func(x: int) -> int:
@@ -321,9 +360,9 @@ class TestPydanticPluginConfigure:
         result = sw["strict_func"]("hello")
         assert result == "hellohello"
 
-    def test_disable_specific_handler(self):
+    def test_disable_specific_handler(self, pydantic_switcher):
         """Test disabling validation for specific handler."""
-        sw = Switcher().plug("pydantic")
+        sw = pydantic_switcher()
 
         @sw
         def handler1(x: int) -> int:
@@ -348,9 +387,9 @@ class TestPydanticPluginConfigure:
         with pytest.raises(ValidationError):
             sw["handler2"]("not a number")
 
-    def test_re_enable_handler(self):
+    def test_re_enable_handler(self, pydantic_switcher):
         """Test re-enabling validation after disabling."""
-        sw = Switcher().plug("pydantic")
+        sw = pydantic_switcher()
 
         @sw
         def my_func(x: int) -> int:
@@ -360,19 +399,22 @@ class TestPydanticPluginConfigure:
         with pytest.raises(ValidationError):
             sw["my_func"]("invalid")
 
+        # Keep a direct reference: no dynamic __getattr__ per access
+        plugin = sw.plugin("pydantic")
+
         # Disable - validation bypassed
-        sw.pydantic.configure["my_func"].enabled = False
+        plugin.configure["my_func"].enabled = False
         result = sw["my_func"]("test")
         assert result == "testtest"  # No validation
 
         # Re-enable
-        sw.pydantic.configure["my_func"].enabled = True
+        plugin.configure["my_func"].enabled = True
         with pytest.raises(ValidationError):  # Validation is back
             sw["my_func"]("invalid")
 
-    def test_configure_multiple_handlers(self):
+    def test_configure_multiple_handlers(self, pydantic_switcher):
         """Test configuring multiple handlers at once."""
-        sw = Switcher().plug("pydantic")
+        sw = pydantic_switcher()
 
         @sw
         def func1(x: int) -> int:
@@ -387,8 +429,9 @@ class TestPydanticPluginConfigure:
             return x * 4
 
         # Disable validation for func1 and func2 only
-        sw.pydantic.configure["func1"].enabled = False
-        sw.pydantic.configure["func2"].enabled = False
+        plugin = sw.plugin("pydantic")
+        plugin.configure["func1"].enabled = False
+        plugin.configure["func2"].enabled = False
 
         # func1 and func2 don't validate - strings pass through
         assert sw["func1"]("x") == "xx"
@@ -406,42 +449,46 @@ class TestPydanticPluginConfigure:
         def handler1(x: int) -> int:
             return x
 
+        plugin = sw.plugin("pydantic")
+
         # Global config
-        config = sw.pydantic.get_config("handler1")
+        config = plugin.get_config("handler1")
         assert config["global_param"] == "global_value"
         assert config.get("enabled", True) is True
 
         # Override for specific handler
-        proxy = sw.pydantic.configure["handler1"]
+        proxy = plugin.configure["handler1"]
         proxy.handler_param = "handler_value"
         proxy.enabled = False
-        config = sw.pydantic.get_config("handler1")
+        config = plugin.get_config("handler1")
         assert config["global_param"] == "global_value"  # Still has global
         assert config["handler_param"] == "handler_value"  # Has override
         assert config["enabled"] is False  # Override wins
 
-    def test_is_enabled(self):
+    def test_is_enabled(self, pydantic_switcher):
         """Test is_enabled() method."""
-        sw = Switcher().plug("pydantic")
+        sw = pydantic_switcher()
 
         @sw
         def my_handler(x: int) -> int:
             return x
 
+        plugin = sw.plugin("pydantic")
+
         # Initially enabled
-        assert sw.pydantic.is_enabled_for("my_handler") is True
+        assert plugin.is_enabled_for("my_handler") is True
 
         # Disable
-        sw.pydantic.configure["my_handler"].enabled = False
-        assert sw.pydantic.is_enabled_for("my_handler") is False
+        plugin.configure["my_handler"].enabled = False
+        assert plugin.is_enabled_for("my_handler") is False
 
         # Re-enable
-        sw.pydantic.configure["my_handler"].enabled = True
-        assert sw.pydantic.is_enabled_for("my_handler") is True
+        plugin.configure["my_handler"].enabled = True
+        assert plugin.is_enabled_for("my_handler") is True
 
-    def test_plugin_name_property(self):
+    def test_plugin_name_property(self, pydantic_switcher):
         """Test that plugin_name property generates correct name."""
-        sw = Switcher().plug("pydantic")
+        sw = pydantic_switcher()
 
         # PydanticPlugin should register as 'pydantic'
         assert hasattr(sw, "pydantic")
@@ -454,11 +501,11 @@ class TestPydanticPluginConfigure:
 class TestPydanticPluginEdgeCases:
     """Test edge cases and error handling in PydanticPlugin."""
 
-    def test_unresolvable_type_hints_disables_validation(self):
+    def test_unresolvable_type_hints_disables_validation(self, pydantic_switcher):
         """Test that get_type_hints exception disables validation (lines 78-81)."""
         # Import to avoid NameError at runtime
 
-        sw = Switcher().plug("pydantic")
+        sw = pydantic_switcher()
 
         # Create function with problematic annotation that will cause get_type_hints to fail
         # Using a forward reference that can't be resolved
@@ -470,9 +517,9 @@ class TestPydanticPluginEdgeCases:
         result = sw["handler_with_bad_hint"](42)
         assert result == 42
 
-    def test_signature_binding_error_propagates(self):
+    def test_signature_binding_error_propagates(self, pydantic_switcher):
         """Test that TypeError during signature binding propagates (lines 154-156)."""
-        sw = Switcher().plug("pydantic")
+        sw = pydantic_switcher()
 
         @sw
         def handler(x: int, y: int) -> int:
@@ -1,3 +1,4 @@
+import sys
 import unittest
 
 from smartswitch.core import BasePlugin, Switcher
@@ -21,7 +22,8 @@ class MetaPlugin(BasePlugin):
 
 class TracePlugin(BasePlugin):
     def on_decore(self, switch, func, entry):
-        label = self.config.get("label", self.name)
+        # Interned tags: the trace asserts compare interned str pointers.
+        label = sys.intern(self.config.get("label", self.name))
         entry.metadata.setdefault("trace", []).append(label)
 
 
@@ -82,6 +84,22 @@ class TestSwitcher(unittest.TestCase):
         self.assertEqual(Child.main["run"](obj, 5), "run:5")
         self.assertEqual(Child.main["special"](obj, 7), "special:7")
 
+    def test_dispatch_method(self):
+        obj = Child()
+        self.assertEqual(Child.main.dispatch("run", obj, 5), "run:5")
+        self.assertEqual(Child.main.dispatch("special", obj, 7), "special:7")
+
+    def test_call_by_function_identity(self):
+        sw = Switcher("calls")
+
+        def run(x):
+            return x * 2
+
+        sw(run)
+        self.assertEqual(sw.call(run, 4), 8)
+        with self.assertRaises(NotImplementedError):
+            sw.call(lambda x: x, 1)
+
     def test_dotted_path_dispatch(self):
         obj = Child()
         # child switch is attached under main; we name it "child"